@@ -33,6 +33,11 @@ const PATTERNS = {
   JWT: /\beyJ[a-zA-Z0-9_-]*\.eyJ[a-zA-Z0-9_-]*\.[a-zA-Z0-9_-]*\b/
 };
 
+// Global-flag copies of the built-in patterns, compiled once at module load
+const GLOBAL_PATTERNS = Object.fromEntries(
+  Object.entries(PATTERNS).map(([name, regex]) => [name, new RegExp(regex.source, 'g')])
+);
+
 /**
  * Scans text for specific PII types.
  * @param {string} text - The raw input.
@@ -91,8 +96,10 @@ export function scanText(text, options = {}, legacyRedact = false, legacyAllow =
     const regex = allPatterns[rule];
     if (!regex) continue;
 
-    // Create global regex for matching
-    const globalRegex = new RegExp(regex.source, 'g');
+    // Create global regex for matching (built-ins are precompiled, custom rules are not)
+    const globalRegex = regex === PATTERNS[rule]
+      ? GLOBAL_PATTERNS[rule]
+      : new RegExp(regex.source, 'g');
     const matches = text.match(globalRegex);
 
     if (matches && matches.length > 0) {
@@ -10,11 +10,21 @@ const INJECTION_PATTERNS = [
     { pattern: /disable safety procedures/i, score: 1.0, name: 'DISABLE_SAFETY' }
 ];
 
+// All patterns fused into one alternation so clean text is rejected in a single pass
+const ANY_INJECTION = new RegExp(
+    INJECTION_PATTERNS.map(item => `(?:${item.pattern.source})`).join('|'),
+    'i'
+);
+
 /**
  * Scans text for Prompt Injection attacks.
  * Returns a risk score (0-1).
  */
 export function scanInjection(text: string): InjectionResult {
+    if (!ANY_INJECTION.test(text)) {
+        return { score: 0, isDetected: false, reason: undefined };
+    }
+
     let maxScore = 0;
     let detected = false;
     let reason = '';
@@ -10,6 +10,11 @@ const PATTERNS: Record<string, RegExp> = {
     JWT: /\beyJ[a-zA-Z0-9_-]*\.eyJ[a-zA-Z0-9_-]*\.[a-zA-Z0-9_-]*\b/
 };
 
+// Global-flag copies for exec() iteration, compiled once rather than on every scan
+const GLOBAL_PATTERNS: Record<string, RegExp> = Object.fromEntries(
+    Object.entries(PATTERNS).map(([key, regex]) => [key, new RegExp(regex.source, 'g')])
+);
+
 // Context keywords that increase confidence it is PII
 const CONTEXT_TRIGGERS: Record<string, string[]> = {
     SSN: ['ssn', 'social', 'security', 'number', 'id'],
@@ -39,10 +44,11 @@ export function scanPII(text: string, options: PIIOption = {}): PIIResult {
     );
 
     for (const ruleKey of rules) {
-        const regex = PATTERNS[ruleKey];
-        if (!regex) continue;
+        const globalRegex = GLOBAL_PATTERNS[ruleKey];
+        if (!globalRegex) continue;
 
-        const globalRegex = new RegExp(regex.source, 'g');
+        // Shared regex: always start from the beginning of this text
+        globalRegex.lastIndex = 0;
         let match: RegExpExecArray | null;
 
         while ((match = globalRegex.exec(text)) !== null) {
@@ -91,15 +97,14 @@ export function scanPII(text: string, options: PIIOption = {}): PIIResult {
 
     // Redaction Logic
     if (!isClean && (redact || mode === 'block')) {
-        // Replace unique matches to avoid double work
-        const uniqueMatches = [...new Set(findings.map(f => f.match))];
-        for (const m of uniqueMatches) {
-            // Find finding for this match to get type
-            const type = findings.find(f => f.match === m)?.type || 'PII';
-
-            // Escape match for regex replacement
-            const escaped = m.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-            cleanText = cleanText.replace(new RegExp(escaped, 'g'), `[${type}_REDACTED]`);
+        // Replace unique matches to avoid double work; the first finding decides the type
+        const typeByMatch = new Map<string, string>();
+        for (const f of findings) {
+            if (!typeByMatch.has(f.match)) typeByMatch.set(f.match, f.type);
+        }
+        for (const [m, type] of typeByMatch) {
+            // Literal replace-all: no escaping or RegExp compile per match
+            cleanText = cleanText.split(m).join(`[${type}_REDACTED]`);
         }
     }
 
@@ -88,6 +88,16 @@ describe('scanText with allow-lists', () => {
     expect(result.findings[0].type).toBe('TICKET_ID');
   });
 
+  it('custom rules override built-in patterns of the same name', () => {
+    const customRules = [{ name: 'EMAIL', pattern: /ACME-\d{3}/ }];
+    const result = scanText('Mail test@example.com about ACME-123', ['EMAIL'], false, [], customRules);
+    expect(result.findings).toEqual([{ type: 'EMAIL', matches: ['ACME-123'] }]);
+
+    // The shared built-in regex is untouched for later calls
+    const builtIn = scanText('Mail test@example.com', ['EMAIL']);
+    expect(builtIn.findings).toEqual([{ type: 'EMAIL', matches: ['test@example.com'] }]);
+  });
+
   it('redacts with allow-list respected', () => {
     const allowList = ['public@company.com'];
     const result = scanText(